@@ -5,6 +5,7 @@ Demo script that runs the Turing machine and takes screenshots
 
 import sys
 import os
+from functools import lru_cache
 
 # Set display for headless mode
 os.environ['SDL_VIDEODRIVER'] = 'dummy'
@@ -12,138 +13,181 @@ os.environ['SDL_VIDEODRIVER'] = 'dummy'
 # Import pygame after setting display
 import pygame
 
-# Import TuringMachine from main module
-from turing_machine import TuringMachine
+# Import TuringMachine and the shared layout constants and colors from main module
+from turing_machine import (
+    TuringMachine, STATE_NAMES,
+    WINDOW_WIDTH, WINDOW_HEIGHT, CELL_SIZE, CELL_MARGIN,
+    VISIBLE_CELLS, TAPE_START_X, TAPE_Y,
+    WHITE, BLACK, BLUE, GREEN, RED, GRAY, LIGHT_BLUE, YELLOW,
+)
 
 # Initialize Pygame
 pygame.init()
 
-# Constants
-WINDOW_WIDTH = 1200
-WINDOW_HEIGHT = 700
-CELL_SIZE = 60
-CELL_MARGIN = 5
 
-# Colors
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-BLUE = (70, 130, 255)
-GREEN = (50, 205, 50)
-RED = (255, 69, 69)
-GRAY = (200, 200, 200)
-LIGHT_BLUE = (173, 216, 255)
-YELLOW = (255, 255, 150)
+font = pygame.font.Font(None, 36)
+title_font = pygame.font.Font(None, 48)
+small_font = pygame.font.Font(None, 24)
 
 
-def draw_visualization(screen, machine, step_num):
-    """Draw the complete visualization."""
-    font = pygame.font.Font(None, 36)
-    title_font = pygame.font.Font(None, 48)
-    small_font = pygame.font.Font(None, 24)
-    
-    # Background
-    screen.fill(LIGHT_BLUE)
+def _build_background():
+    """Render the parts of the visualization that never change."""
+    background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    background.fill(LIGHT_BLUE)
     
     # Title
     title = title_font.render("Turing Machine Simulator", True, BLACK)
-    screen.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 20))
+    background.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 20))
     
     desc = small_font.render("Example: Binary Increment (Input: 1011 → Output: 1100)", True, GRAY)
-    screen.blit(desc, (WINDOW_WIDTH // 2 - desc.get_width() // 2, 70))
+    background.blit(desc, (WINDOW_WIDTH // 2 - desc.get_width() // 2, 70))
     
-    # Draw tape
-    tape_start_x = 50
-    tape_y = 250
+    # Instructions
+    instructions = [
+        "Controls:",
+        "SPACE - Step forward",
+        "R - Reset",
+        "P - Pause/Resume",
+        "Q - Quit"
+    ]
+    
+    y_offset = 450
+    for i, instruction in enumerate(instructions):
+        text = small_font.render(instruction, True, BLACK)
+        background.blit(text, (WINDOW_WIDTH - 300, y_offset + i * 30))
+    
+    # Transition table
+    table_title = small_font.render("State Transitions:", True, BLACK)
+    background.blit(table_title, (WINDOW_WIDTH - 550, 450))
+    
+    transitions_display = [
+        "start + (0|1) → stay, move R",
+        "start + _ → carry, move L",
+        "carry + 0 → write 1, halt",
+        "carry + 1 → write 0, move L",
+    ]
     
-    visible_cells = min(15, len(machine.tape))
+    y_offset = 480
+    for i, trans in enumerate(transitions_display):
+        text = small_font.render(trans, True, GRAY)
+        background.blit(text, (WINDOW_WIDTH - 550, y_offset + i * 25))
+    
+    return background
+
+
+def _build_cell(color, border):
+    """Render a tape cell with its border."""
+    cell = pygame.Surface((CELL_SIZE, CELL_SIZE))
+    cell.fill(color)
+    pygame.draw.rect(cell, BLACK, cell.get_rect(), border)
+    return cell
+
+
+# Static text is rasterized once; each frame only draws what changes
+_BACKGROUND = _build_background()
+_HEAD_TEXT = small_font.render("HEAD", True, RED)
+_IDX_TEXT = [small_font.render(str(i), True, GRAY) for i in range(128)]
+_CELL_WHITE = _build_cell(WHITE, 2)
+_CELL_YELLOW = _build_cell(YELLOW, 3)
+_GLYPH = {symbol: font.render(chr(symbol), True, BLACK) for symbol in b'_01'}
+
+# Tape layout; the same cell positions are reused every frame
+_X_POSITIONS = [TAPE_START_X + v * (CELL_SIZE + CELL_MARGIN) for v in range(VISIBLE_CELLS)]
+_CELL_CENTERS = [(x + CELL_SIZE // 2, TAPE_Y + CELL_SIZE // 2) for x in _X_POSITIONS]
+_IDX_CENTERS = [(x + CELL_SIZE // 2, TAPE_Y + CELL_SIZE + 20) for x in _X_POSITIONS]
+
+# Screen regions that change between frames: the tape with its head and
+# index labels, and the state/steps/reading lines
+_TAPE_AREA = pygame.Rect(0, 180, WINDOW_WIDTH, 170)
+_STATE_AREA = pygame.Rect(0, 390, 600, 150)
+
+
+@lru_cache(maxsize=256)
+def _render_text(text, color):
+    """Render text with the regular font, reusing earlier renders."""
+    return font.render(text, True, color)
+
+
+def _snapshot(machine):
+    """Everything about the machine that shows up on screen."""
+    return (bytes(machine.tape), machine.head_position, machine.current_state,
+            machine.halted, machine.step_count)
+
+
+def draw_visualization(screen, machine, step_num, full=True):
+    """
+    Draw the complete visualization. With full=False the screen must already
+    hold a previous frame, and only the tape and state regions are redrawn.
+    """
+    # Background with title, instructions and transition table
+    if full:
+        screen.blit(_BACKGROUND, (0, 0))
+    else:
+        screen.blit(_BACKGROUND, _TAPE_AREA, _TAPE_AREA)
+        screen.blit(_BACKGROUND, _STATE_AREA, _STATE_AREA)
+    
+    # Draw tape
+    visible_cells = min(VISIBLE_CELLS, len(machine.tape))
     start_idx = max(0, machine.head_position - 7)
     end_idx = min(len(machine.tape), start_idx + visible_cells)
     
-    for i in range(start_idx, end_idx):
-        x = tape_start_x + (i - start_idx) * (CELL_SIZE + CELL_MARGIN)
-        
-        if i == machine.head_position:
-            color = YELLOW
-            pygame.draw.rect(screen, color, (x, tape_y, CELL_SIZE, CELL_SIZE))
-            pygame.draw.rect(screen, BLACK, (x, tape_y, CELL_SIZE, CELL_SIZE), 3)
-        else:
-            color = WHITE
-            pygame.draw.rect(screen, color, (x, tape_y, CELL_SIZE, CELL_SIZE))
-            pygame.draw.rect(screen, BLACK, (x, tape_y, CELL_SIZE, CELL_SIZE), 2)
+    # Grow the index label cache if the tape ran past it
+    while len(_IDX_TEXT) < end_idx:
+        _IDX_TEXT.append(small_font.render(str(len(_IDX_TEXT)), True, GRAY))
+    
+    # Cells and their labels are collected and blitted in two batches
+    cells = []
+    labels = []
+    for v, i in enumerate(range(start_idx, end_idx)):
+        cell = _CELL_YELLOW if i == machine.head_position else _CELL_WHITE
+        cells.append((cell, (_X_POSITIONS[v], TAPE_Y)))
         
         symbol = machine.tape[i]
-        text = font.render(symbol, True, BLACK)
-        text_rect = text.get_rect(center=(x + CELL_SIZE // 2, tape_y + CELL_SIZE // 2))
-        screen.blit(text, text_rect)
+        text = _GLYPH.get(symbol)
+        if text is None:
+            text = _GLYPH[symbol] = font.render(chr(symbol), True, BLACK)
+        labels.append((text, text.get_rect(center=_CELL_CENTERS[v])))
         
-        idx_text = small_font.render(str(i), True, GRAY)
-        idx_rect = idx_text.get_rect(center=(x + CELL_SIZE // 2, tape_y + CELL_SIZE + 20))
-        screen.blit(idx_text, idx_rect)
+        idx_text = _IDX_TEXT[i]
+        labels.append((idx_text, idx_text.get_rect(center=_IDX_CENTERS[v])))
+    
+    screen.blits(cells, doreturn=False)
+    screen.blits(labels, doreturn=False)
     
     # Draw head arrow
     visible_pos = machine.head_position - start_idx
-    x = tape_start_x + visible_pos * (CELL_SIZE + CELL_MARGIN)
+    x = _X_POSITIONS[visible_pos]
     
     arrow_points = [
-        (x + CELL_SIZE // 2, tape_y - 30),
-        (x + CELL_SIZE // 2 - 15, tape_y - 10),
-        (x + CELL_SIZE // 2 + 15, tape_y - 10)
+        (x + CELL_SIZE // 2, TAPE_Y - 30),
+        (x + CELL_SIZE // 2 - 15, TAPE_Y - 10),
+        (x + CELL_SIZE // 2 + 15, TAPE_Y - 10)
     ]
     pygame.draw.polygon(screen, RED, arrow_points)
     
-    head_text = small_font.render("HEAD", True, RED)
-    head_rect = head_text.get_rect(center=(x + CELL_SIZE // 2, tape_y - 50))
-    screen.blit(head_text, head_rect)
+    head_rect = _HEAD_TEXT.get_rect(center=(x + CELL_SIZE // 2, TAPE_Y - 50))
+    screen.blit(_HEAD_TEXT, head_rect)
     
     # Draw state
     state_y = 400
     
+    state_name = STATE_NAMES[machine.current_state]
     if machine.halted:
         state_color = RED
-        state_text = f"State: {machine.current_state} (HALTED)"
+        state_text = f"State: {state_name} (HALTED)"
     else:
         state_color = GREEN
-        state_text = f"State: {machine.current_state}"
+        state_text = f"State: {state_name}"
     
-    text = font.render(state_text, True, state_color)
+    text = _render_text(state_text, state_color)
     screen.blit(text, (50, state_y))
     
-    step_text = font.render(f"Steps: {machine.step_count}", True, BLACK)
+    step_text = _render_text(f"Steps: {machine.step_count}", BLACK)
     screen.blit(step_text, (50, state_y + 50))
     
-    symbol = machine.tape[machine.head_position]
-    symbol_text = font.render(f"Reading: '{symbol}'", True, BLUE)
+    symbol = chr(machine.tape[machine.head_position])
+    symbol_text = _render_text(f"Reading: '{symbol}'", BLUE)
     screen.blit(symbol_text, (50, state_y + 100))
-    
-    # Instructions
-    instructions = [
-        "Controls:",
-        "SPACE - Step forward",
-        "R - Reset",
-        "P - Pause/Resume",
-        "Q - Quit"
-    ]
-    
-    y_offset = 450
-    for i, instruction in enumerate(instructions):
-        text = small_font.render(instruction, True, BLACK)
-        screen.blit(text, (WINDOW_WIDTH - 300, y_offset + i * 30))
-    
-    # Transition table
-    table_title = small_font.render("State Transitions:", True, BLACK)
-    screen.blit(table_title, (WINDOW_WIDTH - 550, 450))
-    
-    transitions_display = [
-        "start + (0|1) → stay, move R",
-        "start + _ → carry, move L",
-        "carry + 0 → write 1, halt",
-        "carry + 1 → write 0, move L",
-    ]
-    
-    y_offset = 480
-    for i, trans in enumerate(transitions_display):
-        text = small_font.render(trans, True, GRAY)
-        screen.blit(text, (WINDOW_WIDTH - 550, y_offset + i * 25))
 
 
 def main():
@@ -157,6 +201,7 @@ def main():
     
     # Initial state
     draw_visualization(screen, machine, 0)
+    last_drawn = _snapshot(machine)
     pygame.image.save(screen, "/tmp/tm_initial.png")
     print("✓ Saved initial state screenshot")
     screenshots.append("Initial state (Input: 1011)")
@@ -164,10 +209,20 @@ def main():
     # Step through a few times
     for i in range(4):
         machine.step()
-        draw_visualization(screen, machine, i + 1)
-        pygame.image.save(screen, f"/tmp/tm_step{i+1}.png")
-        print(f"✓ Saved step {i+1} screenshot (State: {machine.current_state})")
-        screenshots.append(f"Step {i+1} (State: {machine.current_state})")
+        
+        # Nothing visible changed, so the last screenshot still applies
+        snapshot = _snapshot(machine)
+        if snapshot == last_drawn:
+            print(f"- Skipped step {i+1} screenshot (unchanged)")
+            continue
+        
+        draw_visualization(screen, machine, i + 1, full=False)
+        last_drawn = snapshot
+        # Intermediate steps are saved as uncompressed BMP to skip PNG encoding
+        pygame.image.save(screen, f"/tmp/tm_step{i+1}.bmp")
+        state_name = STATE_NAMES[machine.current_state]
+        print(f"✓ Saved step {i+1} screenshot (State: {state_name})")
+        screenshots.append(f"Step {i+1} (State: {state_name})")
     
     # Run until halt
     step_num = 5
@@ -175,10 +230,12 @@ def main():
         step_num += 1
     
     # Final state
-    draw_visualization(screen, machine, step_num)
+    if _snapshot(machine) != last_drawn:
+        draw_visualization(screen, machine, step_num, full=False)
     pygame.image.save(screen, "/tmp/tm_final.png")
-    print(f"✓ Saved final state screenshot (Output: {''.join(machine.tape[1:5])})")
-    screenshots.append(f"Final state (Output: {''.join(machine.tape[1:5])})")
+    output = machine.tape[1:5].decode('ascii')
+    print(f"✓ Saved final state screenshot (Output: {output})")
+    screenshots.append(f"Final state (Output: {output})")
     
     print("\nScreenshots saved:")
     for ss in screenshots:
@@ -4,23 +4,43 @@ Test script for Turing Machine logic (without GUI)
 """
 
 import sys
+from functools import lru_cache
+from typing import Tuple
 
 # Import the TuringMachine class from the main module
-from turing_machine import TuringMachine
+from turing_machine import (TuringMachine, STATE_NAMES, NUMPY_AVAILABLE, run_batch,
+                            BINARY_INCREMENT_TRANSITIONS, START, CARRY, WRITE1,
+                            HALT, BLANK, ZERO, ONE, LEFT, RIGHT, STAY)
 
 
 def get_binary_number(tape):
     """Extract the binary number from the tape."""
-    # Find first and last non-blank symbols
-    result = []
-    found_digit = False
-    for symbol in tape:
-        if symbol in ['0', '1']:
-            found_digit = True
-            result.append(symbol)
-        elif found_digit and symbol == '_':
-            break
-    return ''.join(result)
+    # Skip leading blanks, then take digits up to the next blank
+    digits = tape.lstrip(b'_')
+    end = digits.find(b'_')
+    if end >= 0:
+        digits = digits[:end]
+    return digits.decode('ascii')
+
+
+def format_tape(tape, width=8):
+    """Space-separated symbols of the first cells of the tape."""
+    return ' '.join(tape[:width].decode('ascii'))
+
+
+@lru_cache(maxsize=256)
+def _simulate(initial_tape: bytes) -> Tuple[bytes, int]:
+    """Run a fresh machine on the given tape until it halts (cached per tape)."""
+    machine = TuringMachine()
+    machine.tape = bytearray(initial_tape)
+    machine.run(100)
+    return bytes(machine.tape), machine.step_count
+
+
+def _run_case(initial_tape: bytes) -> Tuple[str, str, int]:
+    """Simulate one test case; returns the initial and final binary numbers and the step count."""
+    final_tape, steps = _simulate(initial_tape)
+    return get_binary_number(initial_tape), get_binary_number(final_tape), steps
 
 
 def test_binary_increment():
@@ -33,23 +53,23 @@ def test_binary_increment():
     # Get initial number
     initial = get_binary_number(machine.tape)
     initial_decimal = int(initial, 2) if initial else 0
-    print(f"Initial tape: {' '.join(machine.tape[:8])}")
+    print(f"Initial tape: {format_tape(machine.tape)}")
     print(f"Initial binary: {initial} (decimal: {initial_decimal})")
     print()
     
     # Run the machine
     print("Executing steps...")
-    step = 0
-    while machine.step():
-        step += 1
-        print(f"Step {step}: State={machine.current_state}, "
+    
+    def trace(machine):
+        print(f"Step {machine.step_count}: State={STATE_NAMES[machine.current_state]}, "
               f"Pos={machine.head_position}, "
-              f"Symbol={machine.tape[machine.head_position]}, "
-              f"Tape={' '.join(machine.tape[:8])}")
-        
-        if step > 100:  # Safety limit
-            print("ERROR: Too many steps! Machine may be in infinite loop.")
-            sys.exit(1)
+              f"Symbol={chr(machine.tape[machine.head_position])}, "
+              f"Tape={format_tape(machine.tape)}")
+    
+    machine.run(101, trace_cb=trace)  # Safety limit
+    if not machine.halted:
+        print("ERROR: Too many steps! Machine may be in infinite loop.")
+        sys.exit(1)
     
     print()
     print(f"Machine halted after {machine.step_count} steps")
@@ -57,7 +77,7 @@ def test_binary_increment():
     # Get final number
     final = get_binary_number(machine.tape)
     final_decimal = int(final, 2) if final else 0
-    print(f"Final tape: {' '.join(machine.tape[:8])}")
+    print(f"Final tape: {format_tape(machine.tape)}")
     print(f"Final binary: {final} (decimal: {final_decimal})")
     print()
     
@@ -77,25 +97,18 @@ def test_multiple_cases():
     print("=" * 50)
     
     test_cases = [
-        ['_', '1', '_', '_', '_'],           # 1 -> 10
-        ['_', '1', '0', '_', '_', '_'],      # 10 -> 11
-        ['_', '1', '1', '_', '_', '_'],      # 11 -> 100
-        ['_', '1', '1', '1', '_', '_', '_'], # 111 -> 1000
+        b'_1___',    # 1 -> 10
+        b'_10___',   # 10 -> 11
+        b'_11___',   # 11 -> 100
+        b'_111___',  # 111 -> 1000
     ]
     
+    results = [_run_case(initial_tape) for initial_tape in test_cases]
+    
     all_passed = True
     
-    for i, initial_tape in enumerate(test_cases):
-        machine = TuringMachine()
-        machine.tape = initial_tape.copy()
-        
-        initial = get_binary_number(machine.tape)
+    for i, (initial, final, steps) in enumerate(results):
         initial_decimal = int(initial, 2) if initial else 0
-        
-        while machine.step() and machine.step_count < 100:
-            pass
-        
-        final = get_binary_number(machine.tape)
         final_decimal = int(final, 2) if final else 0
         
         expected = initial_decimal + 1
@@ -104,7 +117,268 @@ def test_multiple_cases():
         
         status = "✓" if passed else "✗"
         print(f"{status} Test {i+1}: {initial} ({initial_decimal}) -> {final} ({final_decimal}), "
-              f"Expected: {expected}")
+              f"Expected: {expected} ({steps} steps)")
+    
+    print()
+    if all_passed:
+        print("✓ All tests passed!")
+    else:
+        print("✗ Some tests failed!")
+    
+    return all_passed
+
+
+def test_macro_steps():
+    """Test that macro steps give the same result as single steps."""
+    print("\nTesting Macro Steps")
+    print("=" * 50)
+    
+    test_cases = [
+        b'_1011___',
+        b'_1111111___',
+        b'_10000000___',
+        b'_' + b'1' * 40 + b'___',
+        # Long number of short mixed runs ending in a long carry
+        b'_' + b'1101001110' * 20000 + b'1' * 5000 + b'___',
+    ]
+    
+    all_passed = True
+    
+    for i, initial_tape in enumerate(test_cases):
+        single = TuringMachine()
+        single.tape = bytearray(initial_tape)
+        while single.step() and single.step_count < 1000000:
+            pass
+        
+        macro = TuringMachine()
+        macro.tape = bytearray(initial_tape)
+        calls = 0
+        while macro.step_macro() and calls < 1000000:
+            calls += 1
+        
+        passed = (macro.tape == single.tape
+                  and macro.head_position == single.head_position
+                  and macro.step_count == single.step_count
+                  and macro.halted)
+        all_passed = all_passed and passed
+        
+        status = "✓" if passed else "✗"
+        initial = get_binary_number(initial_tape)
+        if len(initial) > 40:
+            summary = f"{len(initial)}-digit number"
+        else:
+            summary = f"{initial} -> {get_binary_number(macro.tape)}"
+        print(f"{status} Test {i+1}: {summary} in {macro.step_count} steps "
+              f"({calls} macro steps)")
+    
+    print()
+    if all_passed:
+        print("✓ All tests passed!")
+    else:
+        print("✗ Some tests failed!")
+    
+    return all_passed
+
+
+# Custom tables exercising the tape edges: a STAY on the last cell followed
+# by a RIGHT move, repeated RIGHT moves off the end, and a LEFT move at cell 0
+CUSTOM_CASES = [
+    (b'1', 0, {
+        (START, ONE): (WRITE1, ONE, STAY),
+        (WRITE1, ONE): (HALT, ONE, RIGHT),
+    }),
+    (b'01', 1, {
+        (START, ONE): (CARRY, ZERO, STAY),
+        (CARRY, ZERO): (CARRY, ONE, RIGHT),
+        (CARRY, ONE): (CARRY, ZERO, RIGHT),
+        (CARRY, BLANK): (WRITE1, ONE, RIGHT),
+        (WRITE1, BLANK): (HALT, ONE, LEFT),
+    }),
+    (b'_1', 0, {
+        (START, BLANK): (START, ZERO, LEFT),
+        (START, ZERO): (CARRY, ONE, LEFT),
+        (CARRY, ONE): (HALT, BLANK, STAY),
+    }),
+]
+
+
+def _custom_machine(initial_tape, head, transitions):
+    """A machine with the given tape, head position and transition table."""
+    machine = TuringMachine()
+    machine.tape = bytearray(initial_tape)
+    machine.head_position = head
+    machine.transitions = dict(transitions)
+    machine.compile_transitions()
+    return machine
+
+
+def test_custom_tables():
+    """Test that run() matches single steps for custom transition tables."""
+    print("\nTesting Custom Transition Tables")
+    print("=" * 50)
+    
+    all_passed = True
+    
+    for i, (initial_tape, head, transitions) in enumerate(CUSTOM_CASES):
+        single = _custom_machine(initial_tape, head, transitions)
+        while single.step() and single.step_count < 1000:
+            pass
+        
+        machine = _custom_machine(initial_tape, head, transitions)
+        machine.run(1000)
+        
+        passed = (machine.tape == single.tape
+                  and machine.head_position == single.head_position
+                  and machine.step_count == single.step_count
+                  and machine.halted)
+        all_passed = all_passed and passed
+        
+        status = "✓" if passed else "✗"
+        print(f"{status} Test {i+1}: {format_tape(initial_tape)} -> "
+              f"{format_tape(machine.tape)}, head {machine.head_position}, "
+              f"{machine.step_count} steps")
+    
+    print()
+    if all_passed:
+        print("✓ All tests passed!")
+    else:
+        print("✗ Some tests failed!")
+    
+    return all_passed
+
+
+def test_batch_run():
+    """Test that a batch run gives the same result as running each machine."""
+    print("\nTesting Batch Run")
+    print("=" * 50)
+    
+    if not NUMPY_AVAILABLE:
+        # Without numpy run_batch() just calls run() on every machine
+        print("- Skipped: numpy is not installed")
+        return True
+    
+    test_cases = [
+        b'_1011___',
+        b'_1111___',
+        b'_0000___',
+        b'_1___',
+        b'_11111111___',
+        b'_' + b'1' * 40 + b'___',
+    ]
+    
+    machines = []
+    for initial_tape in test_cases:
+        tm = TuringMachine()
+        tm.tape = bytearray(initial_tape)
+        machines.append(tm)
+    steps = run_batch(machines, 1000)
+    
+    all_passed = True
+    
+    for i, (initial_tape, tm, taken) in enumerate(zip(test_cases, machines, steps)):
+        single = TuringMachine()
+        single.tape = bytearray(initial_tape)
+        expected = single.run(1000)
+        
+        passed = (tm.tape == single.tape
+                  and tm.head_position == single.head_position
+                  and taken == expected
+                  and tm.halted)
+        all_passed = all_passed and passed
+        
+        status = "✓" if passed else "✗"
+        print(f"{status} Test {i+1}: {get_binary_number(initial_tape)} -> "
+              f"{get_binary_number(tm.tape)} in {taken} steps")
+    
+    # Custom tables, stepped one by one for reference
+    for i, (initial_tape, head, transitions) in enumerate(CUSTOM_CASES):
+        single = _custom_machine(initial_tape, head, transitions)
+        while single.step() and single.step_count < 1000:
+            pass
+        
+        machines = [_custom_machine(initial_tape, head, transitions) for _ in range(2)]
+        steps = run_batch(machines, 1000)
+        
+        passed = all(tm.tape == single.tape
+                     and tm.head_position == single.head_position
+                     and taken == single.step_count
+                     and tm.halted
+                     for tm, taken in zip(machines, steps))
+        all_passed = all_passed and passed
+        
+        status = "✓" if passed else "✗"
+        print(f"{status} Custom {i+1}: {format_tape(initial_tape)} -> "
+              f"{format_tape(machines[0].tape)}, head {machines[0].head_position}, "
+              f"{steps[0]} steps")
+    
+    print()
+    if all_passed:
+        print("✓ All tests passed!")
+    else:
+        print("✗ Some tests failed!")
+    
+    return all_passed
+
+
+def test_fast_increment():
+    """Test that the bitwise fast path gives the same result as run()."""
+    print("\nTesting Fast Binary Increment")
+    print("=" * 50)
+    
+    test_cases = [
+        b'_1011___',
+        b'_1111___',
+        b'_0000___',
+        b'_0111___',
+        b'_1___',
+        b'_' + b'1' * 40 + b'___',
+        b'_' + b'10' * 20 + b'_',
+    ]
+    
+    all_passed = True
+    
+    for i, initial_tape in enumerate(test_cases):
+        single = TuringMachine()
+        single.tape = bytearray(initial_tape)
+        expected = single.run(1000)
+        
+        fast = TuringMachine()
+        fast.tape = bytearray(initial_tape)
+        taken = fast.run_fast_binary_increment(1000)
+        
+        passed = (fast.tape == single.tape
+                  and fast.head_position == single.head_position
+                  and fast.step_count == single.step_count
+                  and taken == expected
+                  and fast.halted)
+        all_passed = all_passed and passed
+        
+        status = "✓" if passed else "✗"
+        print(f"{status} Test {i+1}: {get_binary_number(initial_tape)} -> "
+              f"{get_binary_number(fast.tape)} in {taken} steps")
+    
+    # Rules changed in the module table must not be shortcut as a plain
+    # increment
+    changed = {
+        (CARRY, ZERO): (WRITE1, ZERO, STAY),
+        (WRITE1, ZERO): (HALT, ZERO, STAY),
+    }
+    original = {key: BINARY_INCREMENT_TRANSITIONS[key] for key in changed}
+    BINARY_INCREMENT_TRANSITIONS.update(changed)
+    try:
+        single = TuringMachine()
+        single.run(1000)
+        fast = TuringMachine()
+        fast.run_fast_binary_increment(1000)
+    finally:
+        BINARY_INCREMENT_TRANSITIONS.update(original)
+    
+    passed = fast.tape == single.tape and fast.step_count == single.step_count
+    all_passed = all_passed and passed
+    
+    status = "✓" if passed else "✗"
+    print(f"{status} Custom table: 1011 -> {get_binary_number(fast.tape)} "
+          f"in {fast.step_count} steps")
     
     print()
     if all_passed:
@@ -118,8 +392,13 @@ def test_multiple_cases():
 if __name__ == "__main__":
     success1 = test_binary_increment()
     success2 = test_multiple_cases()
+    success3 = test_macro_steps()
+    success4 = test_custom_tables()
+    success5 = test_batch_run()
+    success6 = test_fast_increment()
     
-    if success1 and success2:
+    if (success1 and success2 and success3 and success4 and success5
+            and success6):
         print("\n" + "=" * 50)
         print("All tests completed successfully!")
         print("The Turing machine is working correctly.")
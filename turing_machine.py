@@ -8,8 +8,10 @@ Example Machine: Binary Increment
 - Output: Binary number + 1 (e.g., "1100" = 12 in decimal)
 """
 
+import re
 import sys
-from typing import Dict, Tuple, List
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
 
 # Pygame import is deferred until needed to avoid issues in headless environments
 try:
@@ -18,12 +20,36 @@ try:
 except ImportError:
     PYGAME_AVAILABLE = False
 
+# Numba is optional; without it the run loop below executes as plain Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        def decorator(func):
+            return func
+        return decorator
+
+# numpy is optional; without it run_batch() runs the machines one by one
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Constants
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 700
 CELL_SIZE = 60
 CELL_MARGIN = 5
-FPS = 2  # Animation speed
+VISIBLE_CELLS = 15
+TAPE_START_X = 50
+TAPE_Y = 250
+FRAME_RATE = 60  # Frames per second, keeps input responsive
+STEP_INTERVAL_MS = 500  # Animation speed: time between automatic steps
 
 # Colors
 WHITE = (255, 255, 255)
@@ -35,6 +61,127 @@ GRAY = (200, 200, 200)
 LIGHT_BLUE = (173, 216, 255)
 YELLOW = (255, 255, 150)
 
+# Tape symbols, stored on the tape as raw bytes
+BLANK = ord('_')
+ZERO = ord('0')
+ONE = ord('1')
+
+# States
+START = 0
+CARRY = 1
+WRITE1 = 2
+HALT = 3
+STATE_NAMES = ('start', 'carry', 'write1', 'halt')
+NUM_STATES = len(STATE_NAMES)
+
+# One slot per possible byte value in the flattened transition table
+SYMBOL_BASE = 256
+
+# Head directions
+LEFT = -1
+RIGHT = 1
+STAY = 0
+
+INITIAL_TAPE = b'_1011___'
+
+# Transition table for binary increment
+# Format: (state, symbol) -> (new_state, write_symbol, direction)
+BINARY_INCREMENT_TRANSITIONS = {
+    # Start state: move right to find the rightmost digit
+    (START, ZERO): (START, ZERO, RIGHT),
+    (START, ONE): (START, ONE, RIGHT),
+    (START, BLANK): (CARRY, BLANK, LEFT),  # Found blank, go back to start carry
+    
+    # Carry state: handle carry operation
+    (CARRY, ZERO): (WRITE1, ONE, STAY),   # 0 + carry = 1, done
+    (CARRY, ONE): (CARRY, ZERO, LEFT),    # 1 + carry = 0, continue carry
+    (CARRY, BLANK): (WRITE1, ONE, STAY),  # Blank + carry = 1 (overflow)
+    
+    # Write 1 and halt
+    (WRITE1, ZERO): (HALT, ONE, STAY),
+    (WRITE1, ONE): (HALT, ONE, STAY),
+    (WRITE1, BLANK): (HALT, ONE, STAY),
+}
+
+# Blank cells appended ahead of the compiled run loop, so it rarely has
+# to stop and hand back to Python to grow the tape
+TAPE_PADDING = bytes([BLANK]) * 4096
+
+
+def _flatten_transitions(transitions):
+    """
+    Flatten a transition table into (next_state, write_symbol, direction)
+    arrays indexed by state * SYMBOL_BASE + symbol. Missing transitions have
+    a next state of -1.
+    """
+    size = NUM_STATES * SYMBOL_BASE
+    next_state = array('b', [-1]) * size
+    write_symbol = array('B', bytes(size))
+    direction = array('b', bytes(size))
+    
+    for (state, symbol), (new_state, write, move) in transitions.items():
+        index = state * SYMBOL_BASE + symbol
+        next_state[index] = new_state
+        write_symbol[index] = write
+        direction[index] = move
+    
+    return next_state, write_symbol, direction
+
+
+# The unmodified binary increment table as compiled at import, which is
+# what run_fast_binary_increment() knows how to shortcut
+_BINARY_INCREMENT_ARRAYS = _flatten_transitions(BINARY_INCREMENT_TRANSITIONS)
+
+
+# Compiled searches for the first byte that differs from a given symbol,
+# filled in on demand by _other_symbol()
+_OTHER_SYMBOL: Dict[int, 're.Pattern'] = {}
+
+
+def _other_symbol(symbol: int) -> 're.Pattern':
+    """Pattern matching any byte except symbol."""
+    pattern = _OTHER_SYMBOL.get(symbol)
+    if pattern is None:
+        pattern = _OTHER_SYMBOL[symbol] = re.compile(
+            b'[^' + re.escape(bytes((symbol,))) + b']')
+    return pattern
+
+
+@njit(cache=True)
+def _run_steps(tape, length, head, state, next_state, write_symbol, direction, max_steps):
+    """
+    Execute transitions until the machine halts, hits a missing transition,
+    has taken max_steps steps or its tape has grown to fill the buffer.
+    tape is a buffer of blanks beyond the first length cells, which are the
+    machine's tape as step() sees it; the tape grows within the buffer by
+    the same rule as step(). Returns (head, state, steps, length).
+    """
+    capacity = len(tape)
+    steps = 0
+    while steps < max_steps and state != HALT and length < capacity:
+        index = state * SYMBOL_BASE + tape[head]
+        new_state = next_state[index]
+        if new_state < 0:
+            break
+        
+        tape[head] = write_symbol[index]
+        state = new_state
+        move = direction[index]
+        
+        # Same head move as step(): clamp to the tape, and a right move
+        # ending on the last cell appends a blank
+        last = length - 1
+        head += move
+        if head < 0:
+            head = 0
+        elif head > last:
+            head = last
+        if move > 0 and head == last:
+            length += 1
+        steps += 1
+    
+    return head, state, steps, length
+
 
 class TuringMachine:
     """
@@ -44,84 +191,317 @@ class TuringMachine:
     - 'start': Initial state, moves to the rightmost digit
     - 'carry': Handles the carry operation (changes 1 to 0, moves left)
     - 'write1': Writes 1 and halts (no more carry needed)
-    - 'halt': Final state
+    - 'halt': Final state, also entered when no transition matches
     
     Transition function format:
     (current_state, read_symbol) -> (new_state, write_symbol, direction)
-    where direction: 'L' = Left, 'R' = Right, 'N' = No move
+    where direction: LEFT, RIGHT or STAY (no move)
+    
+    States are small ints (see STATE_NAMES) and the tape is a bytearray
+    holding the ASCII codes of '_', '0' and '1'.
     """
     
+    __slots__ = ('tape', 'head_position', 'current_state', 'transitions',
+                 '_next_state', '_write_symbol', '_direction',
+                 'step_count')
+    
     def __init__(self):
         # Tape and head position
-        self.tape: List[str] = ['_', '1', '0', '1', '1', '_', '_', '_']
+        self.tape: bytearray = bytearray(INITIAL_TAPE)
         self.head_position: int = 1  # Start at first digit
-        self.current_state: str = 'start'
+        self.current_state: int = START
         
         # Transition table for binary increment
-        # Format: (state, symbol) -> (new_state, write_symbol, direction)
-        self.transitions: Dict[Tuple[str, str], Tuple[str, str, str]] = {
-            # Start state: move right to find the rightmost digit
-            ('start', '0'): ('start', '0', 'R'),
-            ('start', '1'): ('start', '1', 'R'),
-            ('start', '_'): ('carry', '_', 'L'),  # Found blank, go back to start carry
-            
-            # Carry state: handle carry operation
-            ('carry', '0'): ('write1', '1', 'N'),  # 0 + carry = 1, done
-            ('carry', '1'): ('carry', '0', 'L'),   # 1 + carry = 0, continue carry
-            ('carry', '_'): ('write1', '1', 'N'),  # Blank + carry = 1 (overflow)
-            
-            # Write 1 and halt
-            ('write1', '0'): ('halt', '1', 'N'),
-            ('write1', '1'): ('halt', '1', 'N'),
-            ('write1', '_'): ('halt', '1', 'N'),
-        }
+        self.transitions: Dict[Tuple[int, int], Tuple[int, int, int]] = dict(
+            BINARY_INCREMENT_TRANSITIONS)
+        
+        self.compile_transitions()
         
-        self.halted = False
         self.step_count = 0
     
+    @property
+    def halted(self) -> bool:
+        """True once the machine is in the halt state."""
+        return self.current_state == HALT
+    
+    def compile_transitions(self):
+        """
+        Flatten the transition table into three parallel arrays indexed by
+        state * SYMBOL_BASE + symbol. Missing transitions have a next state of -1.
+        Call this again after changing transitions; the stepping methods only
+        read the arrays.
+        """
+        self._next_state, self._write_symbol, self._direction = _flatten_transitions(
+            self.transitions)
+    
     def step(self) -> bool:
         """Execute one step of the Turing machine. Returns True if machine continues."""
-        if self.halted or self.current_state == 'halt':
-            self.halted = True
+        if self.current_state == HALT:
             return False
         
-        # Read current symbol
-        current_symbol = self.tape[self.head_position]
-        
-        # Get transition
-        key = (self.current_state, current_symbol)
-        if key not in self.transitions:
-            self.halted = True
+        # Get transition for the current state and symbol
+        index = self.current_state * SYMBOL_BASE + self.tape[self.head_position]
+        new_state = self._next_state[index]
+        if new_state < 0:
+            # No transition for this symbol, so the machine halts
+            self.current_state = HALT
             return False
         
-        new_state, write_symbol, direction = self.transitions[key]
+        direction = self._direction[index]
         
         # Execute transition
-        self.tape[self.head_position] = write_symbol
+        self.tape[self.head_position] = self._write_symbol[index]
         self.current_state = new_state
         
-        # Move head
-        if direction == 'L':
-            self.head_position = max(0, self.head_position - 1)
-        elif direction == 'R':
-            self.head_position = min(len(self.tape) - 1, self.head_position + 1)
-            # Extend tape if needed
-            if self.head_position >= len(self.tape) - 1:
-                self.tape.append('_')
+        # Move head; direction is the offset itself (-1, 0 or +1)
+        last = len(self.tape) - 1
+        self.head_position = min(max(0, self.head_position + direction), last)
+        # Extend tape if needed
+        if direction > 0 and self.head_position == last:
+            self.tape.append(BLANK)
         
         self.step_count += 1
         
         return True
     
+    def step_macro(self) -> bool:
+        """
+        Execute a macro step. When the current transition keeps the state and
+        moves the head, it is applied to the whole run of identical symbols in
+        that direction at once (e.g. a carry over a block of 1s). Otherwise
+        this is a single step(). The tape, head and step count end up exactly
+        as after the equivalent number of step() calls.
+        Returns True if machine continues.
+        """
+        if self.current_state == HALT:
+            return False
+        
+        head = self.head_position
+        symbol = self.tape[head]
+        index = self.current_state * SYMBOL_BASE + symbol
+        direction = self._direction[index]
+        last = len(self.tape) - 1
+        if self._next_state[index] != self.current_state or direction == STAY:
+            return self.step()
+        # A run of one symbol is just a single step
+        if direction < 0:
+            if head == 0 or self.tape[head - 1] != symbol:
+                return self.step()
+        elif head + 1 >= last or self.tape[head + 1] != symbol:
+            return self.step()
+        
+        write = bytes((self._write_symbol[index],))
+        if direction < 0:
+            # Run of the symbol ending at the head, found by scanning a
+            # window left of the head that doubles until the run ends in it
+            size = 64
+            while True:
+                start = max(0, head + 1 - size)
+                window = self.tape[start:head + 1]
+                kept = len(window.rstrip(bytes((symbol,))))
+                if kept or start == 0:
+                    break
+                size *= 2
+            run = len(window) - kept
+            self.tape[head + 1 - run:head + 1] = write * run
+            self.head_position = max(0, head - run)
+        else:
+            # Run of the symbol starting at the head, stopping before the
+            # last cell so the tape grows exactly as in step()
+            match = _other_symbol(symbol).search(self.tape, head, last)
+            run = (match.start() if match else last) - head
+            self.tape[head:head + run] = write * run
+            self.head_position = head + run
+            if self.head_position == last:
+                self.tape.append(BLANK)
+        
+        self.step_count += run
+        
+        return True
+    
+    def run(self, max_steps: int = 10000,
+            trace_cb: Optional[Callable[['TuringMachine'], None]] = None) -> int:
+        """
+        Run until the machine halts or max_steps steps have been executed and
+        return the number of steps taken. If trace_cb is given it is called
+        with the machine after every step; otherwise the whole run happens in
+        run_to_halt().
+        """
+        if trace_cb is None:
+            return self.run_to_halt(max_steps)
+        
+        taken = 0
+        while taken < max_steps and self.step():
+            taken += 1
+            trace_cb(self)
+        
+        return taken
+    
+    def run_to_halt(self, max_steps: int = 10000) -> int:
+        """
+        Run until the machine halts or max_steps steps have been executed.
+        The loop is compiled with Numba when it is installed. Returns the
+        number of steps taken.
+        """
+        taken = 0
+        length = len(self.tape)
+        while self.current_state != HALT and taken < max_steps:
+            # Extend tape ahead of the loop and keep going
+            self.tape.extend(TAPE_PADDING)
+            head, state, steps, length = _run_steps(
+                self.tape, length, self.head_position, self.current_state,
+                self._next_state, self._write_symbol, self._direction,
+                max_steps - taken)
+            
+            self.head_position = head
+            self.current_state = state
+            self.step_count += steps
+            taken += steps
+            
+            if length < len(self.tape) and state != HALT and taken < max_steps:
+                # No transition for the current symbol
+                self.current_state = HALT
+            
+            # Trim the unused padding
+            del self.tape[length:]
+        
+        return taken
+    
+    def run_fast_binary_increment(self, max_steps: int = 10000) -> int:
+        """
+        Run the binary increment in one go: the digits right of the head are
+        read as an integer, incremented and written back, and the step count
+        is computed from the length of the number and its carry chain. The
+        tape, head, state and step count end up exactly as after run().
+        Falls back to run() when the machine is not at the start of a binary
+        increment it can shortcut (custom transitions, no blank-terminated
+        digits under the head, a carry that would run past the digits, or
+        too few max_steps).
+        Returns the number of steps taken.
+        """
+        head = self.head_position
+        tape = self.tape
+        digits = bytes(tape[head:]).lstrip(b'01')
+        n = len(tape) - head - len(digits)
+        if (self.current_state != START or n == 0
+                or (self._next_state, self._write_symbol, self._direction)
+                != _BINARY_INCREMENT_ARRAYS
+                or digits[:1] != bytes([BLANK])):
+            return self.run(max_steps)
+        
+        number = bytes(tape[head:head + n])
+        trailing_ones = n - len(number.rstrip(b'1'))
+        overflow = trailing_ones == n
+        if overflow and (head == 0 or tape[head - 1] not in (BLANK, ZERO)):
+            return self.run(max_steps)
+        
+        # n moves right, one back onto the last digit, one per carried 1
+        # and two to write the final 1 and halt
+        steps = n + trailing_ones + 3
+        if steps > max_steps:
+            return self.run(max_steps)
+        
+        # The scan right grows the tape to one cell past the first blank
+        if len(tape) < head + n + 2:
+            tape.extend(bytes([BLANK]) * (head + n + 2 - len(tape)))
+        
+        result = int(number, 2) + 1
+        if overflow:
+            tape[head - 1:head + n] = format(result, 'b').encode()
+            self.head_position = head - 1
+        else:
+            tape[head:head + n] = format(result, '0%db' % n).encode()
+            self.head_position = head + n - 1 - trailing_ones
+        
+        self.current_state = HALT
+        self.step_count += steps
+        
+        return steps
+    
     def reset(self):
         """Reset the machine to initial state."""
-        self.tape = ['_', '1', '0', '1', '1', '_', '_', '_']
+        # Restore the tape contents in place instead of allocating a new tape
+        self.tape[:] = INITIAL_TAPE
         self.head_position = 1  # Start at first digit
-        self.current_state = 'start'
-        self.halted = False
+        self.current_state = START
         self.step_count = 0
 
 
+def run_batch(machines: List[TuringMachine], max_steps: int = 10000) -> List[int]:
+    """
+    Run several machines until each halts or has taken max_steps steps and
+    return the number of steps each one took. Results match calling run()
+    on every machine. With numpy, machines sharing one transition table are
+    stepped together: all tapes live in one 2D array and each step advances
+    every active machine with a handful of vectorized operations.
+    """
+    if not machines:
+        return []
+    
+    first = machines[0]
+    shared_table = all(
+        m._next_state == first._next_state and m._write_symbol == first._write_symbol
+        and m._direction == first._direction
+        for m in machines)
+    if not NUMPY_AVAILABLE or not shared_table:
+        return [m.run(max_steps) for m in machines]
+    
+    n = len(machines)
+    
+    # Logical tape lengths; the tape rows beyond them are blank padding
+    length = np.array([len(m.tape) for m in machines], np.int64)
+    tapes = np.full((n, int(length.max()) + len(TAPE_PADDING)), BLANK, np.uint8)
+    for k, m in enumerate(machines):
+        tapes[k, :len(m.tape)] = np.frombuffer(m.tape, np.uint8)
+    head = np.array([m.head_position for m in machines], np.int64)
+    state = np.array([m.current_state for m in machines], np.int64)
+    taken = np.zeros(n, np.int64)
+    
+    next_state = np.frombuffer(first._next_state, np.int8).astype(np.int64)
+    write_symbol = np.frombuffer(first._write_symbol, np.uint8)
+    direction = np.frombuffer(first._direction, np.int8).astype(np.int64)
+    
+    while True:
+        active = np.flatnonzero((state != HALT) & (taken < max_steps))
+        if active.size == 0:
+            break
+        
+        cells = head[active]
+        index = state[active] * SYMBOL_BASE + tapes[active, cells]
+        new_state = next_state[index]
+        
+        # No transition for the current symbol: halt without taking a step
+        missing = new_state < 0
+        state[active[missing]] = HALT
+        moving = ~missing
+        active, cells, index = active[moving], cells[moving], index[moving]
+        
+        tapes[active, cells] = write_symbol[index]
+        state[active] = new_state[moving]
+        taken[active] += 1
+        
+        # Same head move as step(): clamp to the tape, and a right move
+        # ending on the last cell appends a blank
+        move = direction[index]
+        last = length[active] - 1
+        cells = np.clip(cells + move, 0, last)
+        head[active] = cells
+        length[active[(move > 0) & (cells == last)]] += 1
+        
+        # Extend all tapes before any of them outgrows the array
+        if active.size and length[active].max() >= tapes.shape[1]:
+            padding = np.full((n, len(TAPE_PADDING)), BLANK, np.uint8)
+            tapes = np.concatenate((tapes, padding), axis=1)
+    
+    for k, m in enumerate(machines):
+        m.tape[:] = tapes[k, :length[k]].tobytes()
+        m.head_position = int(head[k])
+        m.current_state = int(state[k])
+        m.step_count += int(taken[k])
+    
+    return taken.tolist()
+
+
 class TuringMachineVisualizer:
     """Visualizes the Turing Machine execution."""
     
@@ -139,101 +519,197 @@ class TuringMachineVisualizer:
         self.title_font = pygame.font.Font(None, 48)
         self.small_font = pygame.font.Font(None, 24)
         
+        # Title, instructions and transition table never change, so they
+        # are rendered once onto a background layer
+        self.static_layer = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.static_layer.fill(LIGHT_BLUE)
+        self._render_title_to(self.static_layer)
+        self._render_instructions_to(self.static_layer)
+        self._render_transition_table_to(self.static_layer)
+        self.static_layer = self.static_layer.convert()
+        
+        # Tape symbols and cell indices are rendered once and reused
+        self.symbol_surfs = {symbol: self._render_cached(self.font, chr(symbol), BLACK)
+                             for symbol in b'01_'}
+        self.index_surfs = [self._render_cached(self.small_font, str(i), GRAY) for i in range(256)]
+        
+        # Status lines are rendered on first use and then reused
+        self._state_cache: Dict[int, 'pygame.Surface'] = {}
+        self._symbol_cache: Dict[int, 'pygame.Surface'] = {}
+        self._step_text: Tuple[int, Optional['pygame.Surface']] = (-1, None)
+        
+        # Geometry of the visible cells, computed once for all frames
+        self._cell_rects = [
+            pygame.Rect(TAPE_START_X + j * (CELL_SIZE + CELL_MARGIN), TAPE_Y, CELL_SIZE, CELL_SIZE)
+            for j in range(VISIBLE_CELLS)
+        ]
+        self._cell_text_centers = [rect.center for rect in self._cell_rects]
+        self._idx_text_centers = [(rect.centerx, rect.bottom + 20) for rect in self._cell_rects]
+        self._arrow_positions = [(rect.centerx - 15, TAPE_Y - 30) for rect in self._cell_rects]
+        self._head_text_centers = [(rect.centerx, TAPE_Y - 50) for rect in self._cell_rects]
+        self._head_text = self._render_cached(self.small_font, "HEAD", RED)
+        
+        # The head arrow is drawn once, so frames need no pygame.draw calls
+        self._arrow = pygame.Surface((31, 21), pygame.SRCALPHA)
+        pygame.draw.polygon(self._arrow, RED, [(15, 0), (0, 20), (30, 20)])
+        self._arrow = self._arrow.convert_alpha()
+        
+        # Plain and highlighted cells are drawn once and blitted as templates
+        self._cell_tpl = pygame.Surface((CELL_SIZE, CELL_SIZE))
+        self._cell_tpl.fill(WHITE)
+        pygame.draw.rect(self._cell_tpl, BLACK, self._cell_tpl.get_rect(), 2)
+        self._cell_tpl = self._cell_tpl.convert()
+        self._head_cell_tpl = pygame.Surface((CELL_SIZE, CELL_SIZE))
+        self._head_cell_tpl.fill(YELLOW)
+        pygame.draw.rect(self._head_cell_tpl, BLACK, self._head_cell_tpl.get_rect(), 3)
+        self._head_cell_tpl = self._head_cell_tpl.convert()
+        
+        # Screen areas redrawn each frame
+        row_width = VISIBLE_CELLS * (CELL_SIZE + CELL_MARGIN)
+        self._tape_area = pygame.Rect(TAPE_START_X, TAPE_Y, row_width, CELL_SIZE + 40)
+        self._head_area = pygame.Rect(TAPE_START_X, TAPE_Y - 60, row_width, 60)
+        self._state_area = pygame.Rect(50, 400, 550, 130)
+        
+        # (start index, visible symbols, head) of the last drawn tape window
+        self._last_tape_view: Optional[Tuple[int, bytes, int]] = None
+        
         self.machine = TuringMachine()
         self.running = True
         self.paused = False
         self.auto_run = True
+        self._last_step = 0  # pygame.time.get_ticks() of the last auto-step
+        self.dirty = True  # Redraw needed on the next frame
+        self.full_redraw = True  # Repaint the whole window on the next frame
     
-    def draw_tape(self):
-        """Draw the tape cells."""
-        tape_start_x = 50
-        tape_y = 250
-        
-        visible_cells = min(15, len(self.machine.tape))
-        start_idx = max(0, self.machine.head_position - 7)
+    @staticmethod
+    def _render_cached(font, text, color):
+        """
+        Render text for a cache. The surface is converted to the display's
+        pixel format once, so later blits need no per-frame conversion.
+        """
+        return font.render(text, True, color).convert_alpha()
+    
+    def draw_tape(self) -> List['pygame.Rect']:
+        """
+        Draw the tape cells. If the visible window has not scrolled since the
+        last call, only cells whose symbol or highlight changed are redrawn.
+        Returns the screen areas that were drawn.
+        """
+        head = self.machine.head_position
+        visible_cells = min(VISIBLE_CELLS, len(self.machine.tape))
+        start_idx = max(0, head - 7)
         end_idx = min(len(self.machine.tape), start_idx + visible_cells)
         
-        for i in range(start_idx, end_idx):
-            x = tape_start_x + (i - start_idx) * (CELL_SIZE + CELL_MARGIN)
+        view = bytes(self.machine.tape[start_idx:end_idx])
+        last = self._last_tape_view
+        self._last_tape_view = (start_idx, view, head)
+        
+        full = last is None or last[0] != start_idx or len(last[1]) != len(view)
+        if full:
+            # Window scrolled or grew: clear it and draw every cell and index
+            self.screen.blit(self.static_layer, self._tape_area, self._tape_area)
+            cells = range(len(view))
+            
+            # Grow the index cache if the tape ran past it
+            while len(self.index_surfs) < end_idx:
+                self.index_surfs.append(self._render_cached(self.small_font, str(len(self.index_surfs)), GRAY))
+        else:
+            # Same window: the opaque cell templates cover whatever was there
+            _, last_view, last_head = last
+            cells = [j for j in range(len(view))
+                     if view[j] != last_view[j] or start_idx + j in (head, last_head)]
+        
+        # Cells, symbols and indices are collected and blitted in one batch
+        blit_list = []
+        for j in cells:
+            i = start_idx + j
             
             # Highlight current head position
-            if i == self.machine.head_position:
-                color = YELLOW
-                pygame.draw.rect(self.screen, color, (x, tape_y, CELL_SIZE, CELL_SIZE))
-                pygame.draw.rect(self.screen, BLACK, (x, tape_y, CELL_SIZE, CELL_SIZE), 3)
+            if i == head:
+                blit_list.append((self._head_cell_tpl, self._cell_rects[j]))
             else:
-                color = WHITE
-                pygame.draw.rect(self.screen, color, (x, tape_y, CELL_SIZE, CELL_SIZE))
-                pygame.draw.rect(self.screen, BLACK, (x, tape_y, CELL_SIZE, CELL_SIZE), 2)
+                blit_list.append((self._cell_tpl, self._cell_rects[j]))
             
-            # Draw symbol
-            symbol = self.machine.tape[i]
-            text = self.font.render(symbol, True, BLACK)
-            text_rect = text.get_rect(center=(x + CELL_SIZE // 2, tape_y + CELL_SIZE // 2))
-            self.screen.blit(text, text_rect)
+            # Symbol
+            symbol = view[j]
+            text = self.symbol_surfs.get(symbol)
+            if text is None:
+                text = self.symbol_surfs[symbol] = self._render_cached(self.font, chr(symbol), BLACK)
+            blit_list.append((text, text.get_rect(center=self._cell_text_centers[j])))
             
-            # Draw cell index
-            idx_text = self.small_font.render(str(i), True, GRAY)
-            idx_rect = idx_text.get_rect(center=(x + CELL_SIZE // 2, tape_y + CELL_SIZE + 20))
-            self.screen.blit(idx_text, idx_rect)
+            # Cell index, unchanged unless the window moved
+            if full:
+                idx_text = self.index_surfs[i]
+                blit_list.append((idx_text, idx_text.get_rect(center=self._idx_text_centers[j])))
+        
+        self.screen.blits(blit_list, doreturn=False)
+        
+        if full:
+            return [self._tape_area]
+        return [self._cell_rects[j] for j in cells]
     
-    def draw_head(self):
-        """Draw the read/write head indicator."""
-        tape_start_x = 50
-        tape_y = 250
+    def draw_head(self) -> 'pygame.Rect':
+        """Draw the read/write head indicator. Returns the row it can occupy."""
+        self.screen.blit(self.static_layer, self._head_area, self._head_area)
         
         start_idx = max(0, self.machine.head_position - 7)
         visible_pos = self.machine.head_position - start_idx
         
-        x = tape_start_x + visible_pos * (CELL_SIZE + CELL_MARGIN)
+        # Draw arrow pointing to current cell and the "HEAD" label
+        head_rect = self._head_text.get_rect(center=self._head_text_centers[visible_pos])
+        self.screen.blits([
+            (self._arrow, self._arrow_positions[visible_pos]),
+            (self._head_text, head_rect),
+        ], doreturn=False)
         
-        # Draw arrow pointing to current cell
-        arrow_points = [
-            (x + CELL_SIZE // 2, tape_y - 30),
-            (x + CELL_SIZE // 2 - 15, tape_y - 10),
-            (x + CELL_SIZE // 2 + 15, tape_y - 10)
-        ]
-        pygame.draw.polygon(self.screen, RED, arrow_points)
-        
-        # Draw "HEAD" label
-        head_text = self.small_font.render("HEAD", True, RED)
-        head_rect = head_text.get_rect(center=(x + CELL_SIZE // 2, tape_y - 50))
-        self.screen.blit(head_text, head_rect)
+        return self._head_area
     
-    def draw_state(self):
-        """Draw current state information."""
-        state_y = 400
+    def draw_state(self) -> 'pygame.Rect':
+        """Draw current state information. Returns the area of the text block."""
+        self.screen.blit(self.static_layer, self._state_area, self._state_area)
+        state_y = self._state_area.y
         
         # Current state
-        if self.machine.halted:
-            state_color = RED
-            state_text = f"State: {self.machine.current_state} (HALTED)"
-        else:
-            state_color = GREEN
-            state_text = f"State: {self.machine.current_state}"
-        
-        text = self.font.render(state_text, True, state_color)
+        text = self._state_cache.get(self.machine.current_state)
+        if text is None:
+            state_name = STATE_NAMES[self.machine.current_state]
+            if self.machine.halted:
+                state_color = RED
+                state_text = f"State: {state_name} (HALTED)"
+            else:
+                state_color = GREEN
+                state_text = f"State: {state_name}"
+            text = self._render_cached(self.font, state_text, state_color)
+            self._state_cache[self.machine.current_state] = text
         self.screen.blit(text, (50, state_y))
         
-        # Step count
-        step_text = self.font.render(f"Steps: {self.machine.step_count}", True, BLACK)
+        # Step count, re-rendered only when it changes
+        step_count, step_text = self._step_text
+        if step_count != self.machine.step_count:
+            step_text = self._render_cached(self.font, f"Steps: {self.machine.step_count}", BLACK)
+            self._step_text = (self.machine.step_count, step_text)
         self.screen.blit(step_text, (50, state_y + 50))
         
         # Current symbol
         symbol = self.machine.tape[self.machine.head_position]
-        symbol_text = self.font.render(f"Reading: '{symbol}'", True, BLUE)
+        symbol_text = self._symbol_cache.get(symbol)
+        if symbol_text is None:
+            symbol_text = self._render_cached(self.font, f"Reading: '{chr(symbol)}'", BLUE)
+            self._symbol_cache[symbol] = symbol_text
         self.screen.blit(symbol_text, (50, state_y + 100))
+        
+        return self._state_area
     
-    def draw_title(self):
-        """Draw title and description."""
+    def _render_title_to(self, surface):
+        """Render title and description onto surface."""
         title = self.title_font.render("Turing Machine Simulator", True, BLACK)
-        self.screen.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 20))
+        surface.blit(title, (WINDOW_WIDTH // 2 - title.get_width() // 2, 20))
         
         desc = self.small_font.render("Example: Binary Increment (Input: 1011 → Output: 1100)", True, GRAY)
-        self.screen.blit(desc, (WINDOW_WIDTH // 2 - desc.get_width() // 2, 70))
+        surface.blit(desc, (WINDOW_WIDTH // 2 - desc.get_width() // 2, 70))
     
-    def draw_instructions(self):
-        """Draw control instructions."""
+    def _render_instructions_to(self, surface):
+        """Render control instructions onto surface."""
         instructions = [
             "Controls:",
             "SPACE - Step forward",
@@ -245,12 +721,12 @@ class TuringMachineVisualizer:
         y_offset = 450
         for i, instruction in enumerate(instructions):
             text = self.small_font.render(instruction, True, BLACK)
-            self.screen.blit(text, (WINDOW_WIDTH - 300, y_offset + i * 30))
+            surface.blit(text, (WINDOW_WIDTH - 300, y_offset + i * 30))
     
-    def draw_transition_table(self):
-        """Draw a simplified transition table."""
+    def _render_transition_table_to(self, surface):
+        """Render a simplified transition table onto surface."""
         table_title = self.small_font.render("State Transitions:", True, BLACK)
-        self.screen.blit(table_title, (WINDOW_WIDTH - 550, 450))
+        surface.blit(table_title, (WINDOW_WIDTH - 550, 450))
         
         transitions_display = [
             "start + (0|1) → stay, move R",
@@ -262,47 +738,78 @@ class TuringMachineVisualizer:
         y_offset = 480
         for i, trans in enumerate(transitions_display):
             text = self.small_font.render(trans, True, GRAY)
-            self.screen.blit(text, (WINDOW_WIDTH - 550, y_offset + i * 25))
+            surface.blit(text, (WINDOW_WIDTH - 550, y_offset + i * 25))
     
     def handle_events(self):
         """Handle user input."""
-        for event in pygame.event.get():
+        if self.machine.halted or self.paused or not self.auto_run:
+            # Nothing changes on its own, so block until input arrives, then
+            # take everything else that queued up with it
+            events = [pygame.event.wait(500)] + pygame.event.get()
+        else:
+            events = pygame.event.get()
+        
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE,
+                              pygame.WINDOWRESTORED):
+                # The window contents may have been lost
+                self.full_redraw = True
+            
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_q:
                     self.running = False
                 elif event.key == pygame.K_SPACE:
                     if not self.machine.halted:
                         self.machine.step()
+                        self.dirty = True
                 elif event.key == pygame.K_r:
                     self.machine.reset()
                     self.paused = False
+                    self.dirty = True
                 elif event.key == pygame.K_p:
                     self.paused = not self.paused
                     self.auto_run = not self.auto_run
+                    self.dirty = True
     
     def run(self):
         """Main loop."""
         while self.running:
             self.handle_events()
             
-            # Auto-step if not paused
-            if self.auto_run and not self.paused and not self.machine.halted:
+            # Auto-step if not paused, at most once per STEP_INTERVAL_MS
+            # regardless of the frame rate
+            now = pygame.time.get_ticks()
+            if (self.auto_run and not self.paused and not self.machine.halted
+                    and now - self._last_step >= STEP_INTERVAL_MS):
                 self.machine.step()
+                self._last_step = now
+                self.dirty = True
             
-            # Draw everything
-            self.screen.fill(LIGHT_BLUE)
-            self.draw_title()
-            self.draw_tape()
-            self.draw_head()
-            self.draw_state()
-            self.draw_instructions()
-            self.draw_transition_table()
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            if self.full_redraw:
+                # First frame or window exposed: repaint everything
+                self.screen.blit(self.static_layer, (0, 0))
+                self._last_tape_view = None
+                self.draw_tape()
+                self.draw_head()
+                self.draw_state()
+                
+                pygame.display.flip()
+                self.full_redraw = False
+                self.dirty = False
+            # Afterwards the draw_* methods restore the background under what
+            # they redraw and only those areas are pushed to the display.
+            # Skip drawing entirely while nothing has changed (halted or paused)
+            elif self.dirty:
+                dirty = self.draw_tape()
+                dirty.append(self.draw_head())
+                dirty.append(self.draw_state())
+                
+                pygame.display.update(dirty)
+                self.dirty = False
+            self.clock.tick(FRAME_RATE)
         
         pygame.quit()
         sys.exit()